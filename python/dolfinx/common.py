@@ -5,7 +5,7 @@
 # SPDX-License-Identifier:    LGPL-3.0-or-later
 """General tools for timing and configuration."""
 
-import functools
+import threading
 import typing
 
 from dolfinx import cpp as _cpp
@@ -23,6 +23,7 @@ __all__ = [
     "IndexMap",
     "Timer",
     "timed",
+    "timed_fast",
     "git_commit_hash",
     "has_adios2",
     "has_debug",
@@ -109,15 +110,94 @@ class Timer:
         return self._cpp_object.elapsed()
 
 
+def _wraps(wrapper, func):
+    """Copy the identifying attributes of ``func`` to ``wrapper``.
+
+    A lighter-weight alternative to :func:`functools.wraps` that skips
+    copying annotations and updating ``__dict__``.
+    """
+    wrapper.__module__ = func.__module__
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+# Per-thread pool of stopped C++ timers, keyed by task name, that are
+# reused by `timed` to avoid creating a new timer on every call. At most
+# `_max_idle_timers` are kept per task; extra timers created by
+# recursive calls are released.
+_timer_pool = threading.local()
+_max_idle_timers = 2
+
+
+def _free_timers(task: str) -> list[_cpp.common.Timer]:
+    """Return the current thread's list of idle timers for ``task``."""
+    try:
+        pool = _timer_pool.timers
+    except AttributeError:
+        pool = _timer_pool.timers = {}
+    try:
+        return pool[task]
+    except KeyError:
+        return pool.setdefault(task, [])
+
+
 def timed(task: str):
-    """Decorator for timing functions."""
+    """Decorator for timing functions.
+
+    Note:
+        Suitable for coarse-grained functions. For functions that run
+        for only a few microseconds and are called very often, see
+        :func:`timed_fast`.
+    """
 
     def decorator(func):
-        @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            with Timer(task):
+            # Take an idle timer from the pool (a recursive call finds
+            # the pool empty and creates a new one)
+            free = _free_timers(task)
+            t = free.pop() if free else _cpp.common.Timer(task)
+            t.start()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                t.stop()
+                if len(free) < _max_idle_timers:
+                    free.append(t)
+
+        return _wraps(wrapper, func)
+
+    return decorator
+
+
+def timed_fast(task: str):
+    """Decorator for timing small, frequently called functions.
+
+    A single timer is created on the first call and is then started
+    and stopped directly around each call, without the context manager
+    or timer pool used by :func:`timed`.
+
+    Note:
+        The timer is shared by all calls, so the decorated function
+        must not be called recursively or from multiple threads. Use
+        :func:`timed` in these cases.
+    """
+
+    def decorator(func):
+        t = None
+
+        def wrapper(*args, **kwargs):
+            nonlocal t
+            if t is None:
+                t = _cpp.common.Timer(task)
+            t.start()
+            try:
                 return func(*args, **kwargs)
+            finally:
+                t.stop()
 
-        return wrapper
+        return _wraps(wrapper, func)
 
     return decorator
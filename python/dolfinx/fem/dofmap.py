@@ -4,6 +4,11 @@
 #
 # SPDX-License-Identifier:    LGPL-3.0-or-later
 
+import functools
+
+import numpy as np
+import numpy.typing as npt
+
 from dolfinx import cpp as _cpp
 
 
@@ -12,6 +17,9 @@ class DofMap:
 
     This class handles the mapping of degrees of freedom. It builds
     a dof map based on a FiniteElement on a specific mesh.
+
+    The wrapped C++ dofmap is immutable, so properties are computed on
+    first access and cached on the Python object.
     """
 
     _cpp_object: _cpp.fem.DofMap
@@ -26,31 +34,60 @@ class DofMap:
             cell: The cell index.
 
         Returns:
-            Local-global dof map for the cell (using process-local indices).
+            Local-global dof map for the cell (using process-local
+            indices). This is a read-only view into the dofmap data, not
+            a copy.
         """
         return self._cpp_object.cell_dofs(cell_index)
 
-    @property
+    def cell_dofs_many(self, cell_indices: npt.ArrayLike) -> npt.NDArray[np.int32]:
+        """Cell local-global dof maps for a collection of cells.
+
+        Args:
+            cell_indices: One-dimensional array of cell indices.
+
+        Returns:
+            Array of shape ``(num_cells, num_dofs_per_cell)``, where row
+            ``i`` holds the dofs (using process-local indices) of cell
+            ``cell_indices[i]``. The data is a copy.
+
+        Raises:
+            ValueError: If ``cell_indices`` is not one-dimensional.
+            TypeError: If ``cell_indices`` are not integers.
+            IndexError: If a cell index is out of range.
+        """
+        cells = np.asarray(cell_indices)
+        if cells.ndim != 1:
+            raise ValueError(f"Cell indices must be a 1D array, not {cells.ndim}D.")
+        if cells.size == 0:
+            cells = cells.astype(np.int32)
+        elif not np.issubdtype(cells.dtype, np.integer):
+            raise TypeError(f"Cell indices must be integers, not {cells.dtype}.")
+        elif cells.min() < 0 or cells.max() >= self.list.shape[0]:
+            raise IndexError("Cell index out of range.")
+        return self._cpp_object.map_rows(np.ascontiguousarray(cells, dtype=np.int32))
+
+    @functools.cached_property
     def bs(self):
         """Returns the block size of the dofmap"""
         return self._cpp_object.bs
 
-    @property
+    @functools.cached_property
     def dof_layout(self):
         """Layout of dofs on an element."""
         return self._cpp_object.dof_layout
 
-    @property
+    @functools.cached_property
     def index_map(self):
         """Index map that described the parallel distribution of the dofmap."""
         return self._cpp_object.index_map
 
-    @property
+    @functools.cached_property
     def index_map_bs(self):
         """Block size of the index map."""
         return self._cpp_object.index_map_bs
 
-    @property
+    @functools.cached_property
     def list(self):
         """Adjacency list with dof indices for each cell."""
         return self._cpp_object.map()
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import typing
 import warnings
-from functools import singledispatch
+from functools import cached_property, singledispatch
 
 import numpy as np
 import numpy.typing as npt
@@ -792,7 +792,7 @@ class FunctionSpace(ufl.FunctionSpace):
         """Function space finite element."""
         return self._cpp_object.element  # type: ignore
 
-    @property
+    @cached_property
     def dofmap(self) -> dofmap.DofMap:
         """Degree-of-freedom map associated with the function space."""
         return dofmap.DofMap(self._cpp_object.dofmap)  # type: ignore
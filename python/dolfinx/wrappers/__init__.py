@@ -4,9 +4,11 @@
 #
 # SPDX-License-Identifier:    LGPL-3.0-or-later
 
+import pathlib
+
+_include_path = pathlib.Path(__file__).parent
+
 
 def get_include_path():
     """Return path to nanobind wrapper header files"""
-    import pathlib
-
-    return pathlib.Path(__file__).parent
+    return _include_path
@@ -7,6 +7,7 @@
 #include "array.h"
 #include "caster_mpi.h"
 #include "numpy_dtype.h"
+#include <algorithm>
 #include <array>
 #include <cstdint>
 #include <dolfinx/common/IndexMap.h>
@@ -43,9 +44,11 @@
 #include <nanobind/stl/variant.h>
 #include <nanobind/stl/vector.h>
 #include <span>
+#include <stdexcept>
 #include <string>
 #include <ufcx.h>
 #include <utility>
+#include <vector>
 
 namespace nb = nanobind;
 
@@ -1234,7 +1237,32 @@ void fem(nb::module_& m)
                 dofs.data_handle(), {dofs.extent(0), dofs.extent(1)},
                 nb::handle());
           },
-          nb::rv_policy::reference_internal);
+          nb::rv_policy::reference_internal)
+      .def(
+          "map_rows",
+          [](const dolfinx::fem::DofMap& self,
+             nb::ndarray<const std::int32_t, nb::ndim<1>, nb::c_contig> cells)
+          {
+            auto dofs = self.map();
+            const std::size_t num_dofs = dofs.extent(1);
+            std::vector<std::int32_t> rows(cells.size() * num_dofs);
+            for (std::size_t i = 0; i < cells.size(); ++i)
+            {
+              const std::int32_t c = cells(i);
+              if (c < 0 or static_cast<std::size_t>(c) >= dofs.extent(0))
+              {
+                throw std::out_of_range("Cell index " + std::to_string(c)
+                                        + " is out of range.");
+              }
+              std::copy_n(std::next(dofs.data_handle(), c * num_dofs),
+                          num_dofs, std::next(rows.begin(), i * num_dofs));
+            }
+            return dolfinx_wrappers::as_nbarray(std::move(rows),
+                                                {cells.size(), num_dofs});
+          },
+          nb::arg("cells"),
+          "Copy the dofs of the given cells into a (num_cells, "
+          "num_dofs_per_cell) array.");
 
   nb::enum_<dolfinx::fem::IntegralType>(m, "IntegralType")
       .value("cell", dolfinx::fem::IntegralType::cell, "cell integral")
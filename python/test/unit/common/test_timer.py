@@ -6,8 +6,11 @@
 #
 # SPDX-License-Identifier:    LGPL-3.0-or-later
 
+import gc
 from time import sleep
 
+import pytest
+
 from dolfinx import common
 
 
@@ -32,3 +35,71 @@ def test_context_manager_anonymous():
     with common.Timer() as t:
         sleep(0.05)
         assert t.elapsed()[0] > 0.035
+
+
+def test_timed_decorator():
+    """Test that repeated and recursive calls to a timed function are
+    each logged"""
+    task = "test_timed_decorator"
+
+    @common.timed(task)
+    def countdown(n):
+        return n if n == 0 else countdown(n - 1)
+
+    countdown(2)
+    countdown(0)
+    assert common.timing(task)[0] == 4
+
+    # Timers created by deep recursion are not all kept in the pool
+    countdown(20)
+    assert common.timing(task)[0] == 25
+    assert len(common._free_timers(task)) <= common._max_idle_timers
+
+
+def test_timed_fast_decorator():
+    """Test that each call to a timed_fast function is logged"""
+    task = "test_timed_fast_decorator"
+
+    @common.timed_fast(task)
+    def f(x):
+        return 2 * x
+
+    assert [f(i) for i in range(3)] == [0, 2, 4]
+    assert f.__wrapped__(1) == 2
+    assert common.timing(task)[0] == 3
+
+
+def test_timed_fast_decorator_raises():
+    """Test that a timed_fast call that raises is logged once and does
+    not leave the timer running"""
+    task = "test_timed_fast_decorator_raises"
+
+    @common.timed_fast(task)
+    def f(x):
+        if x < 0:
+            raise ValueError
+        return x
+
+    f(1)
+    with pytest.raises(ValueError):
+        f(-1)
+    assert common.timing(task)[0] == 2
+
+    # A running timer would be stopped and logged on destruction
+    del f
+    gc.collect()
+    assert common.timing(task)[0] == 2
+
+
+def test_timed_wrapper_attributes():
+    """Test that timed decorators preserve the wrapped function identity"""
+
+    def f():
+        """Docstring"""
+
+    for decorator in (common.timed, common.timed_fast):
+        g = decorator("test_timed_wrapper_attributes")(f)
+        assert g.__name__ == f.__name__
+        assert g.__qualname__ == f.__qualname__
+        assert g.__doc__ == f.__doc__
+        assert g.__wrapped__ is f
@@ -4,6 +4,8 @@
 #
 # SPDX-License-Identifier:    LGPL-3.0-or-later
 
+import functools
+
 from mpi4py import MPI
 
 import numpy as np
@@ -28,39 +30,133 @@ from dolfinx.fem import (
 from dolfinx.mesh import CellType, create_unit_cube, create_unit_square, exterior_facet_indices
 from ufl import SpatialCoordinate, TestFunction, TrialFunction, div, dx, grad, inner
 
+# Reference element points (x) and interpolation matrices (M) used to
+# define the custom elements below. These are shared by the tests and
+# must not be modified.
+_NO_POINTS = np.zeros((0, 2))
+_NO_DOFS = np.zeros((0, 1, 0, 1))
+_POINT_EVALUATION = np.array([[[[1.0]]]])
+_IDENTITY_3 = np.array([[[[1.0], [0.0], [0.0]]], [[[0.0], [1.0], [0.0]]], [[[0.0], [0.0], [1.0]]]])
+_TRI_VERTICES = [np.array([[0.0, 0.0]]), np.array([[1.0, 0.0]]), np.array([[0.0, 1.0]])]
+_TRI_P4_INTERIOR = np.array([[0.25, 0.25], [0.5, 0.25], [0.25, 0.5]])
+
+_TRI_P1_X = [_TRI_VERTICES, 3 * [_NO_POINTS], [_NO_POINTS], []]
+_TRI_P1_M = [3 * [_POINT_EVALUATION], 3 * [_NO_DOFS], [_NO_DOFS], []]
+
+_TRI_P4_X = [
+    _TRI_VERTICES,
+    [
+        np.array([[0.75, 0.25], [0.5, 0.5], [0.25, 0.75]]),
+        np.array([[0.0, 0.25], [0.0, 0.5], [0.0, 0.75]]),
+        np.array([[0.25, 0.0], [0.5, 0.0], [0.75, 0.0]]),
+    ],
+    [_TRI_P4_INTERIOR],
+    [],
+]
+_TRI_P4_M = [3 * [_POINT_EVALUATION], 3 * [_IDENTITY_3], [_IDENTITY_3], []]
 
-def run_scalar_test(V, degree, dtype, cg_solver, rtol=None):
-    mesh = V.mesh
+_QUAD_P1_X = [
+    [
+        np.array([[0.0, 0.0]]),
+        np.array([[1.0, 0.0]]),
+        np.array([[0.0, 1.0]]),
+        np.array([[1.0, 1.0]]),
+    ],
+    4 * [_NO_POINTS],
+    [_NO_POINTS],
+    [],
+]
+_QUAD_P1_M = [4 * [_POINT_EVALUATION], 4 * [_NO_DOFS], [_NO_DOFS], []]
+
+
+@functools.cache
+def _quad_and_tab(family, cell, degree, order, dtype):
+    """Quadrature points and weights of the given order on ``cell``, and
+    the tabulated basis functions of the degree ``degree`` element
+    ``family`` at these points."""
+    pts, wts = basix.make_quadrature(cell, order)
+    tab = basix.create_element(family, cell, degree, dtype=dtype).tabulate(0, pts)[0, :, :, 0]
+    return pts, wts, tab
+
+
+def _scalar_test_integrands(V, degree):
+    """Bilinear and linear form integrands of the Poisson problem with
+    exact solution ``x[1] ** degree`` solved by :func:`run_scalar_test`.
+
+    ``V`` may be a DOLFINx or an abstract UFL function space."""
     u, v = TrialFunction(V), TestFunction(V)
-    a = inner(grad(u), grad(v)) * dx
+    x = SpatialCoordinate(V.ufl_domain())
+    f = -div(grad(x[1] ** degree))
+    return inner(grad(u), grad(v)), inner(f, v)
+
+
+@functools.cache
+def _quadrature_degrees(element, coordinate_element, degree):
+    """Estimated quadrature degrees for the integrands returned by
+    :func:`_scalar_test_integrands` (ignores effect of non-affine map).
+
+    The estimate only depends on the elements and the degree of the
+    exact solution, so it is computed on an abstract UFL domain and
+    reused for every mesh with the same coordinate element."""
+    domain = ufl.Mesh(coordinate_element)
+    a, L = _scalar_test_integrands(ufl.FunctionSpace(domain, element), degree)
+    return (
+        ufl.algorithms.estimate_total_polynomial_degree(a * dx),
+        ufl.algorithms.estimate_total_polynomial_degree(L * dx),
+    )
+
+
+def _boundary_facets(mesh):
+    """Indices of the exterior facets of ``mesh``."""
+    mesh.topology.create_connectivity(mesh.topology.dim - 1, mesh.topology.dim)
+    return exterior_facet_indices(mesh.topology)
+
+
+@pytest.fixture(scope="module")
+def triangle_mesh(dtype):
+    return create_unit_square(MPI.COMM_WORLD, 10, 10, dtype=dtype)
 
-    # Get quadrature degree for bilinear form integrand (ignores effect of non-affine map)
-    a = inner(grad(u), grad(v)) * dx(metadata={"quadrature_degree": -1})
-    a.integrals()[0].metadata()["quadrature_degree"] = (
-        ufl.algorithms.estimate_total_polynomial_degree(a)
+
+@pytest.fixture(scope="module")
+def triangle_boundary_facets(triangle_mesh):
+    return _boundary_facets(triangle_mesh)
+
+
+def _custom_element_copy(e, dtype):
+    """Custom element built from the data defining the Basix element ``e``."""
+    return basix.ufl.custom_element(
+        e._element.cell_type,
+        e._element.value_shape,
+        e._element.wcoeffs,
+        e._element.x,
+        e._element.M,
+        0,
+        e._element.map_type,
+        e._element.sobolev_space,
+        e._element.discontinuous,
+        e._element.embedded_subdegree,
+        e._element.embedded_superdegree,
+        dtype=dtype,
     )
-    a = form(a, dtype=dtype)
 
-    # Source term
-    x = SpatialCoordinate(mesh)
-    u_exact = x[1] ** degree
-    f = -div(grad(u_exact))
 
-    # Set quadrature degree for linear form integrand (ignores effect of non-affine map)
-    L = inner(f, v) * dx(metadata={"quadrature_degree": -1})
-    L.integrals()[0].metadata()["quadrature_degree"] = (
-        ufl.algorithms.estimate_total_polynomial_degree(L)
+def run_scalar_test(V, degree, dtype, cg_solver, bndry_facets, rtol=None):
+    mesh = V.mesh
+    a, L = _scalar_test_integrands(V, degree)
+    degree_a, degree_L = _quadrature_degrees(
+        V.ufl_element(), mesh.ufl_domain().ufl_coordinate_element(), degree
     )
-    L = form(L, dtype=dtype)
+    a = form(a * dx(metadata={"quadrature_degree": degree_a}), dtype=dtype)
+    L = form(L * dx(metadata={"quadrature_degree": degree_L}), dtype=dtype)
+
+    x = SpatialCoordinate(mesh)
+    u_exact = x[1] ** degree
 
     u_bc = Function(V, dtype=dtype)
     u_bc.interpolate(lambda x: x[1] ** degree)
 
     # Create Dirichlet boundary condition
-    facetdim = mesh.topology.dim - 1
-    mesh.topology.create_connectivity(facetdim, mesh.topology.dim)
-    bndry_facets = exterior_facet_indices(mesh.topology)
-    bdofs = locate_dofs_topological(V, facetdim, bndry_facets)
+    bdofs = locate_dofs_topological(V, mesh.topology.dim - 1, bndry_facets)
     bc = dirichletbc(u_bc, bdofs)
 
     b = assemble_vector(L)
@@ -68,7 +164,6 @@ def run_scalar_test(V, degree, dtype, cg_solver, rtol=None):
     b.scatter_reverse(la.InsertMode.add)
     set_bc(b.array, [bc])
 
-    a = form(a, dtype=dtype)
     A = assemble_matrix(a, bcs=[bc])
     A.scatter_reverse()
 
@@ -84,9 +179,9 @@ def run_scalar_test(V, degree, dtype, cg_solver, rtol=None):
     assert np.isclose(error, 0, atol=eps)
 
 
-@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64], scope="module")
 @pytest.mark.parametrize("degree", range(1, 6))
-def test_basix_element_wrapper(degree, dtype, cg_solver):
+def test_basix_element_wrapper(degree, dtype, cg_solver, triangle_mesh, triangle_boundary_facets):
     ufl_element = basix.ufl.element(
         basix.ElementFamily.P,
         basix.CellType.triangle,
@@ -94,29 +189,19 @@ def test_basix_element_wrapper(degree, dtype, cg_solver):
         basix.LagrangeVariant.gll_isaac,
         dtype=dtype,
     )
-    mesh = create_unit_square(MPI.COMM_WORLD, 10, 10, dtype=dtype)
-    V = functionspace(mesh, ufl_element)
-    run_scalar_test(V, degree, dtype, cg_solver)
+    V = functionspace(triangle_mesh, ufl_element)
+    run_scalar_test(V, degree, dtype, cg_solver, triangle_boundary_facets)
 
 
-@pytest.mark.parametrize("dtype", [np.float32, np.float64])
-def test_custom_element_triangle_degree1(dtype, cg_solver):
+@pytest.mark.parametrize("dtype", [np.float32, np.float64], scope="module")
+def test_custom_element_triangle_degree1(dtype, cg_solver, triangle_mesh, triangle_boundary_facets):
     wcoeffs = np.eye(3)
-    z = np.zeros((0, 2))
-    x = [
-        [np.array([[0.0, 0.0]]), np.array([[1.0, 0.0]]), np.array([[0.0, 1.0]])],
-        [z, z, z],
-        [z],
-        [],
-    ]
-    z = np.zeros((0, 1, 0, 1))
-    M = [[np.array([[[[1.0]]]]), np.array([[[[1.0]]]]), np.array([[[[1.0]]]])], [z, z, z], [z], []]
     ufl_element = basix.ufl.custom_element(
         basix.CellType.triangle,
         [],
         wcoeffs,
-        x,
-        M,
+        _TRI_P1_X,
+        _TRI_P1_M,
         0,
         basix.MapType.identity,
         basix.SobolevSpace.H1,
@@ -125,38 +210,19 @@ def test_custom_element_triangle_degree1(dtype, cg_solver):
         1,
         dtype=dtype,
     )
-    mesh = create_unit_square(MPI.COMM_WORLD, 10, 10, dtype=dtype)
-    V = functionspace(mesh, ufl_element)
-    run_scalar_test(V, 1, dtype, cg_solver)
+    V = functionspace(triangle_mesh, ufl_element)
+    run_scalar_test(V, 1, dtype, cg_solver, triangle_boundary_facets)
 
 
-@pytest.mark.parametrize("dtype", [np.float32, np.float64])
-def test_custom_element_triangle_degree4(dtype, cg_solver):
+@pytest.mark.parametrize("dtype", [np.float32, np.float64], scope="module")
+def test_custom_element_triangle_degree4(dtype, cg_solver, triangle_mesh, triangle_boundary_facets):
     wcoeffs = np.eye(15)
-    x = [
-        [np.array([[0.0, 0.0]]), np.array([[1.0, 0.0]]), np.array([[0.0, 1.0]])],
-        [
-            np.array([[0.75, 0.25], [0.5, 0.5], [0.25, 0.75]]),
-            np.array([[0.0, 0.25], [0.0, 0.5], [0.0, 0.75]]),
-            np.array([[0.25, 0.0], [0.5, 0.0], [0.75, 0.0]]),
-        ],
-        [np.array([[0.25, 0.25], [0.5, 0.25], [0.25, 0.5]])],
-        [],
-    ]
-    id = np.array([[[[1.0], [0.0], [0.0]]], [[[0.0], [1.0], [0.0]]], [[[0.0], [0.0], [1.0]]]])
-    M = [
-        [np.array([[[[1.0]]]]), np.array([[[[1.0]]]]), np.array([[[[1.0]]]])],
-        [id, id, id],
-        [id],
-        [],
-    ]
-
     ufl_element = basix.ufl.custom_element(
         basix.CellType.triangle,
         [],
         wcoeffs,
-        x,
-        M,
+        _TRI_P4_X,
+        _TRI_P4_M,
         0,
         basix.MapType.identity,
         basix.SobolevSpace.H1,
@@ -165,41 +231,34 @@ def test_custom_element_triangle_degree4(dtype, cg_solver):
         4,
         dtype=dtype,
     )
-    mesh = create_unit_square(MPI.COMM_WORLD, 10, 10, dtype=dtype)
-    V = functionspace(mesh, ufl_element)
-    run_scalar_test(V, 4, dtype, cg_solver)
+    V = functionspace(triangle_mesh, ufl_element)
+    run_scalar_test(V, 4, dtype, cg_solver, triangle_boundary_facets)
 
 
-@pytest.mark.parametrize("dtype", [np.float32, np.float64])
-def test_custom_element_triangle_degree4_integral(dtype, cg_solver):
-    pts, wts = basix.make_quadrature(basix.CellType.interval, 10)
-    tab = basix.create_element(
-        basix.ElementFamily.P, basix.CellType.interval, 2, dtype=default_real_type
-    ).tabulate(0, pts)[0, :, :, 0]
+@pytest.mark.parametrize("dtype", [np.float32, np.float64], scope="module")
+def test_custom_element_triangle_degree4_integral(
+    dtype, cg_solver, triangle_mesh, triangle_boundary_facets
+):
+    pts, wts, tab = _quad_and_tab(
+        basix.ElementFamily.P, basix.CellType.interval, 2, 10, default_real_type
+    )
     wcoeffs = np.eye(15)
     x = [
-        [np.array([[0.0, 0.0]]), np.array([[1.0, 0.0]]), np.array([[0.0, 1.0]])],
+        _TRI_VERTICES,
         [
-            np.array([[1.0 - p[0], p[0]] for p in pts]),
-            np.array([[0.0, p[0]] for p in pts]),
-            np.array([[p[0], 0.0] for p in pts]),
+            np.stack([1.0 - pts[:, 0], pts[:, 0]], axis=1),
+            np.stack([np.zeros_like(pts[:, 0]), pts[:, 0]], axis=1),
+            np.stack([pts[:, 0], np.zeros_like(pts[:, 0])], axis=1),
         ],
-        [np.array([[0.25, 0.25], [0.5, 0.25], [0.25, 0.5]])],
+        [_TRI_P4_INTERIOR],
         [],
     ]
 
     assert pts.shape[0] != 3
-    quadrature_mat = np.zeros([3, 1, pts.shape[0], 1])
-    for dof in range(3):
-        for p in range(pts.shape[0]):
-            quadrature_mat[dof, 0, p, 0] = wts[p] * tab[p, dof]
-
-    M = [
-        [np.array([[[[1.0]]]]), np.array([[[[1.0]]]]), np.array([[[[1.0]]]])],
-        [quadrature_mat, quadrature_mat, quadrature_mat],
-        [np.array([[[[1.0], [0.0], [0.0]]], [[[0.0], [1.0], [0.0]]], [[[0.0], [0.0], [1.0]]]])],
-        [],
-    ]
+    quadrature_mat = np.empty((3, 1, pts.shape[0], 1), dtype=default_real_type)
+    quadrature_mat[:, 0, :, 0] = tab.T * wts[None, :]
+
+    M = [3 * [_POINT_EVALUATION], 3 * [quadrature_mat], [_IDENTITY_3], []]
 
     ufl_element = basix.ufl.custom_element(
         basix.CellType.triangle,
@@ -215,44 +274,19 @@ def test_custom_element_triangle_degree4_integral(dtype, cg_solver):
         4,
         dtype=dtype,
     )
-    mesh = create_unit_square(MPI.COMM_WORLD, 10, 10, dtype=dtype)
-    V = functionspace(mesh, ufl_element)
-    run_scalar_test(V, 4, dtype, cg_solver, rtol=1e-5)
+    V = functionspace(triangle_mesh, ufl_element)
+    run_scalar_test(V, 4, dtype, cg_solver, triangle_boundary_facets, rtol=1e-5)
 
 
 @pytest.mark.parametrize("dtype", [np.float32, np.float64])
 def test_custom_element_quadrilateral_degree1(dtype, cg_solver):
     wcoeffs = np.eye(4)
-    z = np.zeros((0, 2))
-    x = [
-        [
-            np.array([[0.0, 0.0]]),
-            np.array([[1.0, 0.0]]),
-            np.array([[0.0, 1.0]]),
-            np.array([[1.0, 1.0]]),
-        ],
-        [z, z, z, z],
-        [z],
-        [],
-    ]
-    z = np.zeros((0, 1, 0, 1))
-    M = [
-        [
-            np.array([[[[1.0]]]]),
-            np.array([[[[1.0]]]]),
-            np.array([[[[1.0]]]]),
-            np.array([[[[1.0]]]]),
-        ],
-        [z, z, z, z],
-        [z],
-        [],
-    ]
     ufl_element = basix.ufl.custom_element(
         basix.CellType.quadrilateral,
         [],
         wcoeffs,
-        x,
-        M,
+        _QUAD_P1_X,
+        _QUAD_P1_M,
         0,
         basix.MapType.identity,
         basix.SobolevSpace.H1,
@@ -263,13 +297,24 @@ def test_custom_element_quadrilateral_degree1(dtype, cg_solver):
     )
     mesh = create_unit_square(MPI.COMM_WORLD, 10, 10, CellType.quadrilateral, dtype=dtype)
     V = functionspace(mesh, ufl_element)
-    run_scalar_test(V, 1, dtype, cg_solver)
+    run_scalar_test(V, 1, dtype, cg_solver, _boundary_facets(mesh))
 
 
-@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.fixture(scope="module")
+def copy_mesh(dtype, cell_type):
+    """Unit square or cube mesh, created once per (dtype, cell type) and
+    shared by the copy tests, which do not modify it."""
+    if cell_type in [CellType.triangle, CellType.quadrilateral]:
+        return create_unit_square(MPI.COMM_WORLD, 10, 10, cell_type, dtype=dtype)
+    else:
+        return create_unit_cube(MPI.COMM_WORLD, 5, 5, 5, cell_type, dtype=dtype)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64], scope="module")
 @pytest.mark.parametrize(
     "cell_type",
     [CellType.triangle, CellType.quadrilateral, CellType.tetrahedron, CellType.hexahedron],
+    scope="module",
 )
 @pytest.mark.parametrize(
     "element_family",
@@ -280,32 +325,15 @@ def test_custom_element_quadrilateral_degree1(dtype, cg_solver):
         basix.ElementFamily.BDM,
     ],
 )
-def test_vector_copy_degree1(cell_type, element_family, dtype):
-    if cell_type in [CellType.triangle, CellType.quadrilateral]:
-        tdim = 2
-        mesh = create_unit_square(MPI.COMM_WORLD, 10, 10, cell_type, dtype=dtype)
-    else:
-        tdim = 3
-        mesh = create_unit_cube(MPI.COMM_WORLD, 5, 5, 5, cell_type, dtype=dtype)
+def test_vector_copy_degree1(cell_type, element_family, dtype, copy_mesh):
+    mesh = copy_mesh
+    tdim = mesh.topology.dim
 
     def func(x):
         return x[:tdim]
 
     e1 = basix.ufl.element(element_family, getattr(basix.CellType, cell_type.name), 1, dtype=dtype)
-    e2 = basix.ufl.custom_element(
-        e1._element.cell_type,
-        e1._element.value_shape,
-        e1._element.wcoeffs,
-        e1._element.x,
-        e1._element.M,
-        0,
-        e1._element.map_type,
-        e1._element.sobolev_space,
-        e1._element.discontinuous,
-        e1._element.embedded_subdegree,
-        e1._element.embedded_superdegree,
-        dtype=dtype,
-    )
+    e2 = _custom_element_copy(e1, dtype)
 
     space1 = functionspace(mesh, e1)
     space2 = functionspace(mesh, e2)
@@ -320,42 +348,26 @@ def test_vector_copy_degree1(cell_type, element_family, dtype):
     assert np.isclose(error, 0)
 
 
-@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64], scope="module")
 @pytest.mark.parametrize(
     "cell_type",
     [CellType.triangle, CellType.quadrilateral, CellType.tetrahedron, CellType.hexahedron],
+    scope="module",
 )
 @pytest.mark.parametrize("element_family", [basix.ElementFamily.P, basix.ElementFamily.serendipity])
-def test_scalar_copy_degree1(cell_type, element_family, dtype):
+def test_scalar_copy_degree1(cell_type, element_family, dtype, copy_mesh):
     if element_family == basix.ElementFamily.serendipity and cell_type in [
         CellType.triangle,
         CellType.tetrahedron,
     ]:
         pytest.xfail("Serendipity elements cannot be created on simplices")
-
-    if cell_type in [CellType.triangle, CellType.quadrilateral]:
-        mesh = create_unit_square(MPI.COMM_WORLD, 10, 10, cell_type, dtype=dtype)
-    else:
-        mesh = create_unit_cube(MPI.COMM_WORLD, 5, 5, 5, cell_type, dtype=dtype)
+    mesh = copy_mesh
 
     def func(x):
         return x[0]
 
     e1 = basix.ufl.element(element_family, getattr(basix.CellType, cell_type.name), 1, dtype=dtype)
-    e2 = basix.ufl.custom_element(
-        e1._element.cell_type,
-        e1._element.value_shape,
-        e1._element.wcoeffs,
-        e1._element.x,
-        e1._element.M,
-        0,
-        e1._element.map_type,
-        e1._element.sobolev_space,
-        e1._element.discontinuous,
-        e1._element.embedded_subdegree,
-        e1._element.embedded_superdegree,
-        dtype=dtype,
-    )
+    e2 = _custom_element_copy(e1, dtype)
 
     space1 = functionspace(mesh, e1)
     space2 = functionspace(mesh, e2)
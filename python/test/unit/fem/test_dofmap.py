@@ -180,6 +180,50 @@ def test_block_size():
         assert V.dofmap.index_map_bs == mesh.geometry.dim
 
 
+def test_cell_dofs_many(mesh):
+    V = functionspace(mesh, ("Lagrange", 2))
+    num_cells = mesh.topology.index_map(mesh.topology.dim).size_local
+    cells = np.arange(num_cells - 1, -1, -2, dtype=np.int32)
+    dofs = V.dofmap.cell_dofs_many(cells)
+    assert dofs.shape == (len(cells), V.dofmap.dof_layout.num_dofs)
+    for c, cell_dofs in zip(cells, dofs):
+        assert np.array_equal(cell_dofs, V.dofmap.cell_dofs(c))
+    assert np.array_equal(dofs, V.dofmap.list[cells])
+    assert V.dofmap.cell_dofs_many(np.zeros(0, dtype=np.int32)).shape == (
+        0,
+        V.dofmap.dof_layout.num_dofs,
+    )
+
+    num_cells_all = V.dofmap.list.shape[0]
+    for bad in ([-1], [num_cells_all], [2**32]):
+        with pytest.raises(IndexError):
+            V.dofmap.cell_dofs_many(np.array(bad, dtype=np.int64))
+    with pytest.raises(TypeError):
+        V.dofmap.cell_dofs_many(np.array([0.5]))
+    with pytest.raises(ValueError):
+        V.dofmap.cell_dofs_many(np.zeros((2, 2), dtype=np.int32))
+    with pytest.raises(IndexError):
+        V.dofmap._cpp_object.map_rows(np.array([-1], dtype=np.int32))
+
+
+def test_cell_dofs_view(mesh):
+    V = functionspace(mesh, ("Lagrange", 1))
+    dofmap = V.dofmap
+    dofs = dofmap.cell_dofs(1)
+    assert not dofs.flags.writeable
+    assert np.shares_memory(dofs, dofmap.list)
+    assert np.array_equal(dofs, dofmap.list[1])
+
+
+def test_dofmap_list_cached(mesh):
+    V = functionspace(mesh, ("Lagrange", 1))
+    assert V.dofmap is V.dofmap
+    dofmap = V.dofmap
+    assert dofmap.list is dofmap.list
+    assert dofmap.index_map is dofmap.index_map
+    assert np.array_equal(dofmap.list, dofmap._cpp_object.map())
+
+
 @pytest.mark.skip
 def test_block_size_real():
     mesh = create_unit_interval(MPI.COMM_WORLD, 12)